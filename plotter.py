@@ -17,220 +17,383 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from collections import defaultdict
-from typing import Dict, List, Tuple
-
-import matplotlib.pyplot as plt
-
-
-def load_results(path: str) -> List[Dict]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: needed only for --stream
+    ijson = None
+
+# One record per measurement; field names match the keys in results.json.
+SERIES_DTYPE = np.dtype(
+    [
+        ("threads", "i4"),
+        ("throughput", "f8"),
+        ("avg_response_ms", "f8"),
+        ("avg_cpu_percent", "f8"),
+        ("avg_disk_write_kbps", "f8"),
+    ]
+)
+
+# Inputs with fewer rows are grouped with NumPy; numba's JIT compile only pays
+# off on very large inputs.
+_NUMBA_MIN_ROWS = 1_000_000
+
+# Rows per block when the number of input rows is not known up front.
+_STREAM_BLOCK_ROWS = 64 * 1024
+
+# Reusable figure layouts: name -> (nrows, ncols, figsize).
+_LAYOUTS = {
+    "single": (1, 1, (8, 5)),
+    "quad": (2, 2, (12, 8)),
+    "three": (1, 3, (15, 4)),
+}
+
+# Panel styling per column: column -> (ylabel, title, colour in multi-panel figures).
+PANEL_SPECS = {
+    "throughput": ("Throughput (requests/sec)", "Throughput", None),
+    "avg_response_ms": ("Avg response time (ms)", "Avg Response Time", "tab:orange"),
+    "avg_cpu_percent": ("Avg CPU %", "CPU Usage", "tab:green"),
+    "avg_disk_write_kbps": ("Avg disk write (KB/s)", "Disk Write", "tab:red"),
+}
+
+# Images saved for each workload: (filename prefix, layout, columns, only for "popular" workloads).
+PLOT_SPECS = [
+    ("throughput", "single", ("throughput",), False),
+    ("response_time", "single", ("avg_response_ms",), False),
+    # throughput, response time, cpu, disk write
+    (
+        "combined",
+        "quad",
+        ("throughput", "avg_response_ms", "avg_cpu_percent", "avg_disk_write_kbps"),
+        False,
+    ),
+    # throughput, response time, cpu
+    ("combined_three", "three", ("throughput", "avg_response_ms", "avg_cpu_percent"), True),
+]
+
+# Figures created so far in this process, keyed by (layout, dpi).
+_FIGURES: Dict[Tuple[str, int], tuple] = {}
+
+# Maps every ASCII character that is not safe in a filename to "_".
+_SAFE_CHARS = set(string.ascii_letters + string.digits + "-_")
+_SANITIZE_TABLE = str.maketrans({chr(c): "_" for c in range(128) if chr(c) not in _SAFE_CHARS})
+
+# Records the dpi of the last run in an output directory, so changing --dpi
+# or --fast re-renders plots that are otherwise newer than the input.
+_STAMP_NAME = ".plotter_dpi"
+
+# Plots are regenerated on every run, so favour PNG encode speed over file size.
+_SAVE_KW = dict(pil_kwargs={"compress_level": 1, "optimize": False})
+
+
+def _configure_matplotlib() -> None:
+    """Apply the styling shared by every plot once, via rcParams."""
+    matplotlib.rcParams.update(
+        {
+            "axes.grid": True,
+            "grid.linestyle": "--",
+            "grid.alpha": 0.4,
+            "lines.marker": "o",
+        }
+    )
+
+
+_configure_matplotlib()
+
+
+def load_results(path: str, stream: bool = False) -> Iterable[Dict]:
+    if stream:
+        if ijson is None:
+            raise ImportError("--stream requires the ijson package")
+        return _iter_results(path)
+    if orjson is not None:
+        # orjson only accepts bytes, so read the file in binary mode
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
     if not isinstance(data, list):
         raise ValueError(f"expected a list in {path}")
     return data
 
 
-def prepare_series(data: List[Dict]) -> Dict[str, List[Tuple[int, float, float, float, float]]]:
+def _iter_results(path: str) -> Iterator[Dict]:
+    """Yield rows of the top-level JSON list one at a time."""
+    with open(path, "rb") as f:
+        events = ijson.parse(f)
+        _, event, _ = next(events, (None, None, None))
+        if event != "start_array":
+            raise ValueError(f"expected a list in {path}")
+        yield from ijson.items(events, "item")
+
+
+def prepare_series(data: Iterable[Dict]) -> Dict[str, Dict[str, np.ndarray]]:
     """Group and sort data by workload_type.
 
-    Returns a dict mapping workload_type -> list of
-    (threads, throughput, avg_response_ms, avg_cpu_percent, avg_disk_write_kbps)
-    sorted by threads.
+    ``data`` may be a list or a one-shot iterator such as the one returned by
+    ``load_results(path, stream=True)``.
+
+    Returns a dict mapping workload_type -> dict of column arrays keyed by
+    threads, throughput, avg_response_ms, avg_cpu_percent and
+    avg_disk_write_kbps, sorted by threads.
     """
-    # Use a dict for each workload to store items by thread count.
-    # This ensures that if we encounter duplicates for the same thread count,
-    # the previous one is overwritten.
-    grouped_by_threads: Dict[str, Dict[int, Tuple[int, float, float, float, float]]] = defaultdict(dict)
+    # Fill pre-sized record blocks in one pass instead of growing lists: a
+    # single exact-size block for lists, fixed-size blocks for iterators.
+    # Workload names are encoded as ints on the fly, numbered in order of
+    # first appearance like the input file, so no per-row strings are kept.
+    block_rows = len(data) if hasattr(data, "__len__") else _STREAM_BLOCK_ROWS
+    blocks: List[np.ndarray] = []
+    idx_blocks: List[np.ndarray] = []
+    buf = np.empty(block_rows, dtype=SERIES_DTYPE)
+    idx_buf = np.empty(block_rows, dtype=np.int64)
+    workload_ids: Dict[str, int] = {}
+    n = 0
     for row in data:
         wt = row.get("workload_type")
         if wt is None:
             continue
-        threads = int(row.get("threads", 0))
-        throughput = float(row.get("throughput", 0.0))
-        avg_ms = float(row.get("avg_response_ms", 0.0))
-        cpu = float(row.get("avg_cpu_percent", 0.0))
-        disk_write = float(row.get("avg_disk_write_kbps", 0.0))
-        grouped_by_threads[wt][threads] = (threads, throughput, avg_ms, cpu, disk_write)
-
-    # Convert back to a list of tuples and sort by threads
-    grouped: Dict[str, List[Tuple[int, float, float, float, float]]] = {}
-    for wt, items_dict in grouped_by_threads.items():
-        grouped[wt] = sorted(items_dict.values(), key=lambda x: x[0])
+        if n == len(buf):
+            blocks.append(buf)
+            idx_blocks.append(idx_buf)
+            buf = np.empty(_STREAM_BLOCK_ROWS, dtype=SERIES_DTYPE)
+            idx_buf = np.empty(_STREAM_BLOCK_ROWS, dtype=np.int64)
+            n = 0
+        buf[n] = (
+            int(row.get("threads", 0)),
+            float(row.get("throughput", 0.0)),
+            float(row.get("avg_response_ms", 0.0)),
+            float(row.get("avg_cpu_percent", 0.0)),
+            float(row.get("avg_disk_write_kbps", 0.0)),
+        )
+        idx_buf[n] = workload_ids.setdefault(wt, len(workload_ids))
+        n += 1
+    if not workload_ids:
+        return {}
+    arr = np.concatenate(blocks + [buf[:n]]) if blocks else buf[:n]
+    wt_idx = np.concatenate(idx_blocks + [idx_buf[:n]]) if idx_blocks else idx_buf[:n]
+
+    order, bounds = _group_sort(wt_idx, arr["threads"], len(workload_ids))
+    arr = arr[order]
+    grouped: Dict[str, Dict[str, np.ndarray]] = {}
+    for i, name in enumerate(workload_ids):
+        sub = arr[bounds[i]:bounds[i + 1]]
+        grouped[name] = {col: sub[col] for col in SERIES_DTYPE.names}
 
     return grouped
 
 
-def plot_throughput(series: Dict[str, List[Tuple[int, float, float]]], outpath: str, dpi: int = 150):
-    plt.figure(figsize=(8, 5), dpi=dpi)
+def _group_sort_numpy(wt_idx: np.ndarray, threads: np.ndarray, n_groups: int):
+    """Order rows by (workload, threads), keeping the last row of any duplicates.
+
+    Returns ``(order, bounds)``: row indices to take, and offsets such that
+    workload ``i`` owns ``order[bounds[i]:bounds[i + 1]]``.
+    """
+    # lexsort is stable, so duplicates stay in input order and keeping the
+    # last of each run lets later rows overwrite earlier ones.
+    order = np.lexsort((threads, wt_idx))
+    w, t = wt_idx[order], threads[order]
+    last = np.append((w[1:] != w[:-1]) | (t[1:] != t[:-1]), True)
+    order = order[last]
+    bounds = np.searchsorted(wt_idx[order], np.arange(n_groups + 1))
+    return order, bounds
+
+
+def _group_sort_loop(wt_idx, threads, n_groups):
+    # Same contract as _group_sort_numpy, written as an explicit loop for numba.
+    t_min = threads.min()
+    span = np.int64(threads.max()) - t_min + 1
+    key = wt_idx.astype(np.int64) * span + (threads - t_min)
+    order = np.argsort(key, kind="mergesort")
+    n = key.size
+    keep = np.empty(n, np.int64)
+    bounds = np.zeros(n_groups + 1, np.int64)
+    m = 0
+    for i in range(n):
+        j = order[i]
+        if i + 1 < n and key[order[i + 1]] == key[j]:
+            continue
+        keep[m] = j
+        m += 1
+        bounds[wt_idx[j] + 1] += 1
+    return keep[:m], np.cumsum(bounds)
+
+
+@lru_cache(maxsize=None)
+def _numba_group_sort():
+    """Compile _group_sort_loop on first use; None if numba is not installed."""
+    try:
+        from numba import njit
+    except ImportError:  # optional: compiled grouping for very large inputs
+        return None
+    return njit(cache=True)(_group_sort_loop)
+
+
+def _group_sort(wt_idx: np.ndarray, threads: np.ndarray, n_groups: int):
+    if len(wt_idx) >= _NUMBA_MIN_ROWS:
+        kernel = _numba_group_sort()
+        if kernel is not None:
+            return kernel(wt_idx, threads, n_groups)
+    return _group_sort_numpy(wt_idx, threads, n_groups)
+
+
+def _new_figure(nrows: int = 1, ncols: int = 1, squeeze: bool = True, **fig_kw):
+    """Create an Agg-backed figure and its axes without touching pyplot state."""
+    fig = Figure(**fig_kw)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols, squeeze=squeeze)
+
+
+def _get_figure(layout: str, dpi: int, keep: bool = False):
+    """Return this process's reusable figure and 2-D axes array for ``layout``.
+
+    With ``keep`` a new pyplot figure is returned instead, so it stays open
+    for display after it has been saved.
+    """
+    nrows, ncols, figsize = _LAYOUTS[layout]
+    if keep:
+        # Only --show needs pyplot and an interactive backend, so it is
+        # imported here rather than at module level.
+        import matplotlib.pyplot as plt
+
+        return plt.subplots(nrows, ncols, squeeze=False, figsize=figsize, dpi=dpi, constrained_layout=True)
+    key = (layout, dpi)
+    if key not in _FIGURES:
+        _FIGURES[key] = _new_figure(
+            nrows, ncols, squeeze=False, figsize=figsize, dpi=dpi, constrained_layout=True
+        )
+    return _FIGURES[key]
+
+
+def _style_axes(ax, xlabel: str, ylabel: str, title: str) -> None:
+    ax.set(xlabel=xlabel, ylabel=ylabel, title=title)
+
+
+def _plot_series(
+    ax, items: Dict[str, np.ndarray], column: str, label: Optional[str] = None, color: Optional[str] = None
+) -> None:
+    # matplotlib looks the columns up in ``items`` itself, so no arrays are copied here.
+    ax.plot("threads", column, data=items, label=label, color=color)
+
+
+def plot_throughput(series: Dict[str, Dict[str, np.ndarray]], outpath: str, dpi: int = 150):
+    fig, ax = _new_figure(figsize=(8, 5), dpi=dpi, constrained_layout=True)
     for wt, items in series.items():
-        threads = [t for t, _, _, _, _ in items]
-        throughput = [tp for _, tp, _, _, _ in items]
-        plt.plot(threads, throughput, marker="o", label=wt)
-
-    plt.xlabel("Threads")
-    plt.ylabel("Throughput (requests/sec)")
-    plt.title("Throughput vs Threads")
-    plt.grid(True, linestyle="--", alpha=0.4)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(outpath)
-    plt.close()
-
-
-def plot_response_time(series: Dict[str, List[Tuple[int, float, float]]], outpath: str, dpi: int = 150):
-    plt.figure(figsize=(8, 5), dpi=dpi)
+        _plot_series(ax, items, "throughput", label=wt)
+
+    _style_axes(ax, "Threads", "Throughput (requests/sec)", "Throughput vs Threads")
+    ax.legend()
+    fig.savefig(outpath, **_SAVE_KW)
+
+
+def plot_response_time(series: Dict[str, Dict[str, np.ndarray]], outpath: str, dpi: int = 150):
+    fig, ax = _new_figure(figsize=(8, 5), dpi=dpi, constrained_layout=True)
     for wt, items in series.items():
-        threads = [t for t, _, _, _, _ in items]
-        avg_ms = [ms for _, _, ms, _, _ in items]
-        plt.plot(threads, avg_ms, marker="o", label=wt)
+        _plot_series(ax, items, "avg_response_ms", label=wt)
 
-    plt.xlabel("Threads")
-    plt.ylabel("Avg response time (ms)")
-    plt.title("Average Response Time vs Threads")
-    plt.grid(True, linestyle="--", alpha=0.4)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(outpath)
-    plt.close()
+    _style_axes(ax, "Threads", "Avg response time (ms)", "Average Response Time vs Threads")
+    ax.legend()
+    fig.savefig(outpath, **_SAVE_KW)
 
 
 def _sanitize_name(name: str) -> str:
     # safe filename fragment
+    if name.isascii():
+        return name.translate(_SANITIZE_TABLE)
     return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in name)
 
 
-def plot_for_workload(wt: str, items: List[Tuple[int, float, float, float, float]], outdir: str, dpi: int = 150):
-    """Create two plots for a single workload type: throughput and response time.
+def _render(
+    layout: str,
+    columns: Tuple[str, ...],
+    wt: str,
+    items: Dict[str, np.ndarray],
+    outpath: str,
+    dpi: int,
+    keep: bool = False,
+) -> str:
+    """Draw one panel per column of ``items`` against threads and save to ``outpath``.
 
-    Saves files as:
-      throughput_<wt>.png and response_time_<wt>.png
+    A single-panel figure is titled "<panel> vs Threads — <wt>" and uses the
+    default line colour; multi-panel figures colour each panel from
+    PANEL_SPECS and share a "Performance — <wt>" suptitle. ``keep`` is
+    passed to _get_figure.
     """
-    safe = _sanitize_name(wt)
-    threads = [t for t, _, _, _, _ in items]
-    throughput = [tp for _, tp, _, _, _ in items]
-    avg_ms = [ms for _, _, ms, _, _ in items]
-
-    # Throughput plot
-    plt.figure(figsize=(8, 5), dpi=dpi)
-    plt.plot(threads, throughput, marker="o")
-    plt.xlabel("Threads")
-    plt.ylabel("Throughput (requests/sec)")
-    plt.title(f"Throughput vs Threads — {wt}")
-    plt.grid(True, linestyle="--", alpha=0.4)
-    plt.tight_layout()
-    tp_path = os.path.join(outdir, f"throughput_{safe}.png")
-    plt.savefig(tp_path)
-    plt.close()
-
-    # Response time plot
-    plt.figure(figsize=(8, 5), dpi=dpi)
-    plt.plot(threads, avg_ms, marker="o")
-    plt.xlabel("Threads")
-    plt.ylabel("Avg response time (ms)")
-    plt.title(f"Avg Response Time vs Threads — {wt}")
-    plt.grid(True, linestyle="--", alpha=0.4)
-    plt.tight_layout()
-    rt_path = os.path.join(outdir, f"response_time_{safe}.png")
-    plt.savefig(rt_path)
-    plt.close()
-
-    return tp_path, rt_path
-
-
-def plot_combined_for_workload(
-        wt: str, items: List[Tuple[int, float, float, float, float]], outdir: str, dpi: int = 150
-) -> str:
-    """Create a combined 2x2 plot for a single workload type.
+    fig, axs = _get_figure(layout, dpi, keep)
+    single = len(columns) == 1
+    for ax, col in zip(axs.flat, columns):
+        ylabel, title, color = PANEL_SPECS[col]
+        ax.clear()
+        if single:
+            title, color = f"{title} vs Threads — {wt}", None
+        _plot_series(ax, items, col, color=color)
+        _style_axes(ax, "Threads", ylabel, title)
+
+    if not single:
+        fig.suptitle(f"Performance — {wt}")
+    fig.savefig(outpath, **_SAVE_KW)
+    return outpath
 
-    Subplots:
-        - Threads vs Throughput
-        - Threads vs Avg response time (ms)
-        - Threads vs Avg CPU percent
-        - Threads vs Avg disk write (KB/s)
 
-    Returns path to saved combined image.
-    """
+def _is_up_to_date(outpath: str, input_mtime: Optional[float]) -> bool:
+    """True if ``outpath`` was written after the input last changed."""
+    return input_mtime is not None and os.path.exists(outpath) and os.path.getmtime(outpath) >= input_mtime
+
+
+def _read_stamp(outdir: str) -> Optional[int]:
+    """Return the dpi recorded by the last run in ``outdir``, if any."""
+    try:
+        with open(os.path.join(outdir, _STAMP_NAME), "r", encoding="utf-8") as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_stamp(outdir: str, dpi: int) -> None:
+    with open(os.path.join(outdir, _STAMP_NAME), "w", encoding="utf-8") as f:
+        f.write(str(dpi))
+
+
+def _workload_outputs(wt: str, outdir: str) -> List[Tuple[str, str, Tuple[str, ...]]]:
+    """Return ``(outpath, layout, columns)`` for every image saved for ``wt``."""
     safe = _sanitize_name(wt)
-    threads = [t for t, _, _, _, _ in items]
-    throughput = [tp for _, tp, _, _, _ in items]
-    avg_ms = [ms for _, _, ms, _, _ in items]
-    cpu = [c for _, _, _, c, _ in items]
-    disk_write = [d for _, _, _, _, d in items]
-
-    fig, axs = plt.subplots(2, 2, figsize=(12, 8), dpi=dpi)
-
-    axs[0, 0].plot(threads, throughput, marker="o")
-    axs[0, 0].set_xlabel("Threads")
-    axs[0, 0].set_ylabel("Throughput (requests/sec)")
-    axs[0, 0].set_title("Throughput")
-    axs[0, 0].grid(True, linestyle="--", alpha=0.4)
-
-    axs[0, 1].plot(threads, avg_ms, marker="o", color="tab:orange")
-    axs[0, 1].set_xlabel("Threads")
-    axs[0, 1].set_ylabel("Avg response time (ms)")
-    axs[0, 1].set_title("Avg Response Time")
-    axs[0, 1].grid(True, linestyle="--", alpha=0.4)
-
-    axs[1, 0].plot(threads, cpu, marker="o", color="tab:green")
-    axs[1, 0].set_xlabel("Threads")
-    axs[1, 0].set_ylabel("Avg CPU %")
-    axs[1, 0].set_title("CPU Usage")
-    axs[1, 0].grid(True, linestyle="--", alpha=0.4)
-
-    axs[1, 1].plot(threads, disk_write, marker="o", color="tab:red")
-    axs[1, 1].set_xlabel("Threads")
-    axs[1, 1].set_ylabel("Avg disk write (KB/s)")
-    axs[1, 1].set_title("Disk Write")
-    axs[1, 1].grid(True, linestyle="--", alpha=0.4)
-
-    fig.suptitle(f"Performance — {wt}")
-    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
-    outpath = os.path.join(outdir, f"combined_{safe}.png")
-    fig.savefig(outpath)
-    plt.close(fig)
-    return outpath
+    popular = "popular" in wt.lower()
+    return [
+        (os.path.join(outdir, f"{prefix}_{safe}.png"), layout, columns)
+        for prefix, layout, columns, popular_only in PLOT_SPECS
+        if popular or not popular_only
+    ]
 
 
-def plot_three_for_workload(
-    wt: str, items: List[Tuple[int, float, float, float, float]], outdir: str, dpi: int = 150
-) -> str:
-    """Create a horizontal 1x3 plot for a workload: throughput, response time, CPU %.
+def _render_workload(
+    job: Tuple[str, Dict[str, np.ndarray], List[Tuple[str, str, Tuple[str, ...]]], int, bool]
+) -> List[str]:
+    """Render the given ``(outpath, layout, columns)`` images for one workload.
+
+    With ``show`` the single-panel throughput and response-time figures are
+    kept open in pyplot for display. Returns the saved paths.
 
-    Returns path to saved image.
+    May run in a worker process, so everything it needs is in ``job``.
     """
-    safe = _sanitize_name(wt)
-    threads = [t for t, _, _, _, _ in items]
-    throughput = [tp for _, tp, _, _, _ in items]
-    avg_ms = [ms for _, _, ms, _, _ in items]
-    cpu = [c for _, _, _, c, _ in items]
-
-    fig, axs = plt.subplots(1, 3, figsize=(15, 4), dpi=dpi)
-
-    axs[0].plot(threads, throughput, marker="o")
-    axs[0].set_xlabel("Threads")
-    axs[0].set_ylabel("Throughput (requests/sec)")
-    axs[0].set_title("Throughput")
-    axs[0].grid(True, linestyle="--", alpha=0.4)
-
-    axs[1].plot(threads, avg_ms, marker="o", color="tab:orange")
-    axs[1].set_xlabel("Threads")
-    axs[1].set_ylabel("Avg response time (ms)")
-    axs[1].set_title("Avg Response Time")
-    axs[1].grid(True, linestyle="--", alpha=0.4)
-
-    axs[2].plot(threads, cpu, marker="o", color="tab:green")
-    axs[2].set_xlabel("Threads")
-    axs[2].set_ylabel("Avg CPU %")
-    axs[2].set_title("CPU Usage")
-    axs[2].grid(True, linestyle="--", alpha=0.4)
-
-    fig.suptitle(f"Performance — {wt}")
-    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
-    outpath = os.path.join(outdir, f"combined_three_{safe}.png")
-    fig.savefig(outpath)
-    plt.close(fig)
-    return outpath
+    wt, items, outputs, dpi, show = job
+    return [
+        _render(layout, columns, wt, items, outpath, dpi, keep=show and layout == "single")
+        for outpath, layout, columns in outputs
+    ]
 
 
 def main() -> None:
@@ -239,56 +402,69 @@ def main() -> None:
     parser.add_argument("--outdir", "-o", default="build/plots", help="directory to save plots")
     parser.add_argument("--show", action="store_true", help="display plots interactively")
     parser.add_argument("--dpi", type=int, default=150, help="dpi for saved images")
+    parser.add_argument("--fast", action="store_true", help="quick preview: render at 100 dpi")
+    parser.add_argument(
+        "--stream", action="store_true", help="parse the input incrementally (for very large files; needs ijson)"
+    )
+    parser.add_argument("--force", action="store_true", help="re-render plots even if they look up to date")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="worker processes for rendering (default: 1, render serially)"
+    )
     args = parser.parse_args()
+    if args.fast:
+        args.dpi = 100
 
     if not os.path.exists(args.input):
         raise SystemExit(f"input file not found: {args.input}")
 
     os.makedirs(args.outdir, exist_ok=True)
 
-    data = load_results(args.input)
+    try:
+        data = load_results(args.input, stream=args.stream)
+    except ImportError as e:
+        raise SystemExit(str(e))
     series = prepare_series(data)
 
     if not series:
         raise SystemExit("no data series found in input")
 
-    created = []
+    # Plots newer than the input and rendered at the same dpi are skipped;
+    # --show always needs fresh figures.
+    reuse = not (args.force or args.show) and _read_stamp(args.outdir) == args.dpi
+    input_mtime = os.path.getmtime(args.input) if reuse else None
+    jobs = []
     for wt, items in series.items():
-        tp_path, rt_path = plot_for_workload(wt, items, args.outdir, dpi=args.dpi)
-        created.append(tp_path)
-        created.append(rt_path)
-        # combined 2x2 figure (throughput, response time, cpu, disk write)
-        combined_path = plot_combined_for_workload(wt, items, args.outdir, dpi=args.dpi)
-        created.append(combined_path)
-        # for "popular" workloads also create a 1x3 combined plot (throughput, response time, cpu)
-        if "popular" in wt.lower():
-            combined3_path = plot_three_for_workload(wt, items, args.outdir, dpi=args.dpi)
-            created.append(combined3_path)
-
-    for p in created:
-        print(f"Saved: {p}")
+        outputs = []
+        for output in _workload_outputs(wt, args.outdir):
+            if _is_up_to_date(output[0], input_mtime):
+                print(f"Up to date: {output[0]}")
+            else:
+                outputs.append(output)
+        if outputs:
+            jobs.append((wt, items, outputs, args.dpi, args.show))
+
+    # Workloads are independent and can be rendered in parallel with --jobs;
+    # each worker reuses its own figures across the workloads it is handed.
+    # It is opt-in because every worker re-imports matplotlib, which costs
+    # more than rendering the usual handful of workloads. With --show the
+    # figures must stay in this process to be displayed afterwards.
+    workers = 1 if args.show else min(len(jobs), max(args.jobs, 1))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_render_workload, jobs))
+    else:
+        results = [_render_workload(job) for job in jobs]
+    if jobs:
+        _write_stamp(args.outdir, args.dpi)
+
+    for paths in results:
+        for p in paths:
+            print(f"Saved: {p}")
 
     if args.show:
-        # re-create figures for interactive viewing
-        for wt, items in series.items():
-            threads = [t for t, _, _, _, _ in items]
-            throughput = [tp for _, tp, _, _, _ in items]
-            avg_ms = [ms for _, _, ms, _, _ in items]
-
-            plt.figure(figsize=(8, 5))
-            plt.plot(threads, throughput, marker="o")
-            plt.xlabel("Threads")
-            plt.ylabel("Throughput (requests/sec)")
-            plt.title(f"Throughput vs Threads — {wt}")
-            plt.grid(True, linestyle="--", alpha=0.4)
-
-            plt.figure(figsize=(8, 5))
-            plt.plot(threads, avg_ms, marker="o")
-            plt.xlabel("Threads")
-            plt.ylabel("Avg response time (ms)")
-            plt.title(f"Avg Response Time vs Threads — {wt}")
-            plt.grid(True, linestyle="--", alpha=0.4)
+        import matplotlib.pyplot as plt
 
+        # the throughput and response-time figures rendered above are still open in pyplot
         plt.show()
 
 